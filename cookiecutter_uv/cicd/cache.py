@@ -0,0 +1,103 @@
+"""File-backed caches for JSON responses from PyPI and GitHub and for file scans."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "cookiecutter-uv"
+CACHE_TTL = 600  # seconds
+SCAN_CACHE_FILE = "scan.json"
+
+
+@dataclass
+class CacheEntry:
+    """A cached JSON response."""
+
+    body: dict[str, Any] | list[Any]
+    etag: str | None = None
+    fresh: bool = False
+
+
+def _cache_path(url: str) -> Path:
+    """Return the cache file for a URL.
+
+    Returns:
+        Path to the cache file, named after a hash of the URL.
+    """
+    return CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def read_cache(url: str, *, ttl: float = CACHE_TTL) -> CacheEntry | None:
+    """Read the cached response for a URL.
+
+    Stale entries are still returned so their ETag can be used to revalidate them.
+
+    Returns:
+        The cache entry, or None if the URL has not been cached.
+    """
+    path = _cache_path(url)
+    try:
+        fresh = path.stat().st_mtime >= time.time() - ttl
+        with path.open() as f:
+            data = json.load(f)
+        return CacheEntry(body=data["body"], etag=data.get("etag"), fresh=fresh)
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def write_cache(url: str, body: dict[str, Any] | list[Any], etag: str | None = None) -> None:
+    """Write a JSON response and its ETag to the cache."""
+    _write_json(_cache_path(url), {"etag": etag, "body": body})
+
+
+def touch_cache(url: str) -> None:
+    """Mark the cached response for a URL as fresh again, e.g. after a 304 response."""
+    with contextlib.suppress(OSError):
+        _cache_path(url).touch()
+
+
+def read_scan_cache(key: list[str]) -> dict[str, Any]:
+    """Read cached file scan results.
+
+    Results are discarded if they were produced for a different key, e.g. a
+    different list of tracked packages.
+
+    Returns:
+        A mapping of file paths to their cached scan entries.
+    """
+    try:
+        with (CACHE_DIR / SCAN_CACHE_FILE).open() as f:
+            data = json.load(f)
+        if data["key"] == key:
+            files: dict[str, Any] = data["files"]
+            return files
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def write_scan_cache(key: list[str], files: dict[str, Any]) -> None:
+    """Write file scan results to the cache."""
+    _write_json(CACHE_DIR / SCAN_CACHE_FILE, {"key": key, "files": files})
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON to a cache file.
+
+    The data is written to a temporary file and renamed into place, so concurrent
+    writers never leave a partially written entry. Failures are ignored since the
+    cache is only an optimization.
+    """
+    with contextlib.suppress(OSError):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            json.dump(data, f)
+        Path(f.name).replace(path)
@@ -2,16 +2,57 @@
 
 from __future__ import annotations
 
+import atexit
+import gzip
+import importlib.util
 import json
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, TypeGuard
+from functools import cache
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, TypeGuard, TypeVar
 from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
+
+from cookiecutter_uv.cicd.cache import read_cache, touch_cache, write_cache
+
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 TIMEOUT = 30
+MAX_WORKERS = 16
+GITHUB_API_URL = "https://api.github.com/"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}graphql"
+DEFAULT_HEADERS = {"User-Agent": "cookiecutter-uv", "Accept-Encoding": "gzip"}
+GITHUB_HEADERS = {"Accept": "application/vnd.github+json"}
+_LATEST_TAG_FIELD = (
+    'refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) { nodes { name } }'
+)
+
+K = TypeVar("K")
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitHubRepo:
     """A GitHub repository reference."""
 
@@ -45,6 +86,7 @@ def _is_list(value: dict[str, Any] | list[Any] | None) -> TypeGuard[list[Any]]:
     return isinstance(value, list)
 
 
+@cache
 def get_pypi_version(package: str) -> str | None:
     """Get the latest version of a package from PyPI.
 
@@ -59,13 +101,14 @@ def get_pypi_version(package: str) -> str | None:
     return None
 
 
+@cache
 def get_github_release(repo: GitHubRepo) -> str | None:
     """Get the latest release tag from GitHub.
 
     Returns:
         The latest release tag (with 'v' prefix stripped), or None if not found or fetch fails.
     """
-    data = _fetch_json(f"https://api.github.com/repos/{repo}/releases/latest")
+    data = _fetch_json(f"{GITHUB_API_URL}repos/{repo}/releases/latest")
     if _is_dict(data):
         # GitHub API returns a dict with structure: {"tag_name": "v1.2.3", ...}
         tag = data.get("tag_name", "")
@@ -73,13 +116,14 @@ def get_github_release(repo: GitHubRepo) -> str | None:
     return None
 
 
+@cache
 def get_github_tag(repo: GitHubRepo) -> str | None:
     """Get the latest tag from GitHub (for repos without releases).
 
     Returns:
         The latest tag (with 'v' prefix stripped), or None if not found or fetch fails.
     """
-    data = _fetch_json(f"https://api.github.com/repos/{repo}/tags")
+    data = _fetch_json(f"{GITHUB_API_URL}repos/{repo}/tags")
     if _is_list(data) and len(data) > 0:
         # GitHub API returns a list of dicts: [{"name": "v1.2.3", ...}, ...]
         first_tag = data[0]
@@ -89,17 +133,177 @@ def get_github_tag(repo: GitHubRepo) -> str | None:
     return None
 
 
+@cache
+def get_github_tags_batch(repos: tuple[GitHubRepo, ...]) -> dict[GitHubRepo, str | None]:
+    """Get the latest tag for several GitHub repositories in a single request.
+
+    Builds one GraphQL query with an aliased `repository` field per repo, so N repos
+    cost one round trip and one rate-limit unit. The GraphQL API requires a token, so
+    without `GITHUB_TOKEN` (or if the query fails) this falls back to concurrent REST
+    calls to `get_github_tag`. Results are memoized per tuple of repos, so updating
+    several config files sends the query once.
+
+    Returns:
+        A mapping of each repo to its latest tag (with 'v' prefix stripped), or None if not found.
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token or not repos:
+        return fetch_all_versions(get_github_tag, repos)
+
+    fields = " ".join(
+        f"r{i}: repository(owner: {json.dumps(repo.owner)}, name: {json.dumps(repo.repo)}) {{ {_LATEST_TAG_FIELD} }}"
+        for i, repo in enumerate(repos)
+    )
+    data = _post_json(GITHUB_GRAPHQL_URL, {"query": f"{{ {fields} }}"}, {"Authorization": f"bearer {token}"})
+    if not _is_dict(data) or not _is_dict(data.get("data")):
+        return fetch_all_versions(get_github_tag, repos)
+
+    # GraphQL returns {"data": {"r0": {"refs": {"nodes": [{"name": "v1.2.3"}]}}, "r1": null, ...}}
+    versions: dict[GitHubRepo, str | None] = {}
+    for i, repo in enumerate(repos):
+        nodes = ((data["data"].get(f"r{i}") or {}).get("refs") or {}).get("nodes") or []
+        tag = nodes[0].get("name", "") if nodes else ""
+        versions[repo] = tag.lstrip("v") if tag else None
+    return versions
+
+
+def fetch_all_versions(fetch: Callable[[K], str | None], keys: Iterable[K]) -> dict[K, str | None]:
+    """Fetch versions for many packages or repositories concurrently.
+
+    The fetchers are I/O-bound, so running them in a thread pool makes the total
+    wall time roughly that of the slowest request instead of the sum of all of them.
+
+    Args:
+        fetch: Fetcher to call for each key, e.g. `get_pypi_version`.
+        keys: Package names or repositories to fetch versions for.
+
+    Returns:
+        A mapping of each key to its fetched version, or None if the fetch failed.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(keys))) as executor:
+        return dict(zip(keys, executor.map(fetch, keys), strict=True))
+
+
+@dataclass(frozen=True)
+class _Response:
+    """A minimal HTTP response, independent of the client library that produced it."""
+
+    status: int
+    body: bytes
+    etag: str | None = None
+
+
+def _http_client() -> httpx.Client:
+    """Return the shared httpx client, creating it on first use.
+
+    Reusing one client pools connections across all fetches, so the TCP and TLS
+    handshakes are paid once per host instead of once per request. HTTP/2 is used
+    when the `h2` package is installed, multiplexing concurrent requests over a
+    single connection.
+
+    Returns:
+        The shared client, closed automatically at interpreter exit.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            http2 = importlib.util.find_spec("h2") is not None
+            _client = httpx.Client(http2=http2, timeout=TIMEOUT, follow_redirects=True)
+            atexit.register(_client.close)
+        return _client
+
+
+def _http_request(url: str, headers: dict[str, str], data: bytes | None = None) -> _Response | None:
+    """Send a GET request, or a POST request if `data` is given.
+
+    Uses the pooled httpx client when httpx is installed, and falls back to urllib.
+    Responses are requested gzip-compressed, and GitHub API calls ask for the
+    GitHub JSON media type.
+
+    Returns:
+        The response (including error statuses), or None if the request could not be made.
+    """
+    method = "GET" if data is None else "POST"
+    headers = {**DEFAULT_HEADERS, **(GITHUB_HEADERS if url.startswith(GITHUB_API_URL) else {}), **headers}
+    if HAS_HTTPX:
+        try:
+            response = _http_client().request(method, url, headers=headers, content=data)
+        except httpx.HTTPError:
+            return None
+        return _Response(response.status_code, response.content, response.headers.get("ETag"))
+
+    request = Request(url, data=data, headers=headers, method=method)  # noqa: S310
+    try:
+        with urlopen(request, timeout=TIMEOUT) as response:  # noqa: S310
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return _Response(response.status, body, response.headers.get("ETag"))
+    except HTTPError as e:
+        return _Response(e.code, b"")
+    except (URLError, EOFError, zlib.error, gzip.BadGzipFile):
+        return None
+
+
+def _parse_json(response: _Response) -> dict[str, Any] | list[Any] | None:
+    """Parse the body of a successful response as JSON, using orjson when installed.
+
+    Returns:
+        Parsed JSON as dict or list, or None if the request failed or the body is not valid JSON.
+    """
+    if response.status != HTTPStatus.OK:
+        return None
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        result: dict[str, Any] | list[Any] = orjson.loads(response.body) if HAS_ORJSON else json.loads(response.body)
+    except json.JSONDecodeError:
+        return None
+    return result
+
+
 def _fetch_json(url: str) -> dict[str, Any] | list[Any] | None:
-    """Fetch JSON from a URL.
+    """Fetch JSON from a URL, serving fresh responses from the on-disk cache.
+
+    Stale cache entries are revalidated with `If-None-Match`, so an unchanged
+    resource costs a bodyless 304 response (which GitHub does not count against
+    the rate limit) instead of a full download.
 
     Returns:
         Parsed JSON as dict or list, or None if fetch fails or URL is invalid.
     """
     if not url.startswith(("https://", "http://")):
         return None
-    try:
-        with urlopen(url, timeout=TIMEOUT) as response:  # noqa: S310
-            result: dict[str, Any] | list[Any] = json.loads(response.read().decode())
-            return result
-    except (HTTPError, URLError, json.JSONDecodeError):
+
+    entry = read_cache(url)
+    if entry is not None and entry.fresh:
+        return entry.body
+
+    headers = {}
+    if entry is not None and entry.etag:
+        headers["If-None-Match"] = entry.etag
+
+    response = _http_request(url, headers)
+    if response is None:
         return None
+    if response.status == HTTPStatus.NOT_MODIFIED and entry is not None:
+        touch_cache(url)
+        return entry.body
+
+    result = _parse_json(response)
+    if result is not None:
+        write_cache(url, result, response.etag)
+    return result
+
+
+def _post_json(url: str, payload: dict[str, Any], headers: dict[str, str]) -> dict[str, Any] | list[Any] | None:
+    """POST a JSON payload to a URL and parse the JSON response.
+
+    Returns:
+        Parsed JSON as dict or list, or None if the request fails.
+    """
+    headers = {"Content-Type": "application/json", **headers}
+    response = _http_request(url, headers, json.dumps(payload).encode())
+    return _parse_json(response) if response is not None else None
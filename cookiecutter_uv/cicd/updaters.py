@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
+from cookiecutter_uv.cicd.cache import read_scan_cache, write_scan_cache
 from cookiecutter_uv.cicd.config import (
     PREK_HOOKS,
     PYPI_PACKAGES,
@@ -14,7 +17,12 @@ from cookiecutter_uv.cicd.config import (
 
 if TYPE_CHECKING:
     from pathlib import Path
-from cookiecutter_uv.cicd.fetchers import get_github_release, get_github_tag, get_pypi_version
+from cookiecutter_uv.cicd.fetchers import (
+    MAX_WORKERS,
+    get_github_release,
+    get_github_tags_batch,
+    get_pypi_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,108 +31,146 @@ class PyprojectTomlUpdater:
     """Updates package versions in pyproject.toml files."""
 
     def __init__(self, files: list[Path]) -> None:
-        self.files = files
-
-    @staticmethod
-    def _build_pattern(package: str) -> str:
-        return rf'("{re.escape(package)}(?:\[[^\]]*\])?)>=([^"]+)"'
+        self.files = [filepath for filepath in files if filepath.exists()]
 
     @staticmethod
-    def _build_replacement(version: str) -> str:
-        return f'\\g<1>>={version}"'
+    @cache
+    def _build_pattern(packages: tuple[str, ...]) -> re.Pattern[bytes]:
+        alternation = b"|".join(re.escape(package.encode()) for package in packages)
+        return re.compile(rb'"(' + alternation + rb')(\[[^\]]*\])?>=([^"]+)"')
 
-    def _update_file(self, filepath: Path, package: str, version: str) -> bool:
-        """Update a single package in a pyproject.toml file.
+    def _update_content(self, content: bytes, versions: dict[str, str]) -> tuple[bytes, list[str]]:
+        """Update every package in pyproject.toml content in a single regex pass.
 
         Returns:
-            True if the file was updated, False otherwise.
+            A tuple of (new_content, updated_packages) listing the packages whose version changed.
         """
-        content = filepath.read_text()
-        pattern = self._build_pattern(package)
-        replacement = self._build_replacement(version)
-        new_content, count = re.subn(pattern, replacement, content)
+        encoded = {package.encode(): version.encode() for package, version in versions.items()}
+        updated: list[str] = []
+
+        def replace(match: re.Match[bytes]) -> bytes:
+            package, extras, current = match.groups()
+            version = encoded[package]
+            if current != version and package.decode() not in updated:
+                updated.append(package.decode())
+            return b'"' + package + (extras or b"") + b">=" + version + b'"'
 
-        if count > 0 and new_content != content:
-            filepath.write_text(new_content)
-            return True
-        return False
+        new_content = self._build_pattern(tuple(versions)).sub(replace, content)
+        return new_content, updated
+
+    def _scan(self, content: bytes) -> dict[str, list[str]]:
+        """Find the current version of every tracked package in pyproject.toml content.
+
+        Returns:
+            A mapping of each package found to the versions it currently requires.
+        """
+        found: dict[str, list[str]] = {}
+        for match in self._build_pattern(tuple(PYPI_PACKAGES)).finditer(content):
+            found.setdefault(match.group(1).decode(), []).append(match.group(3).decode())
+        return found
 
-    def _matches(self, filepath: Path, package: str) -> bool:
-        """Check if file contains the package pattern.
+    @staticmethod
+    def _outdated(found: dict[str, list[str]], versions: dict[str, str]) -> list[str]:
+        """Select the packages with a version that differs from the latest one.
 
         Returns:
-            True if the package pattern is found in the file, False otherwise.
+            The outdated packages, in the order they were found.
         """
-        content = filepath.read_text()
-        return bool(re.search(self._build_pattern(package), content))
+        return [
+            package
+            for package, current in found.items()
+            if package in versions and any(version != versions[package] for version in current)
+        ]
 
     def update(self, *, dry_run: bool = False) -> int:
         """Update all pyproject.toml files.
 
+        Each file is read once, scanned once for all packages, and written at most once.
+        Files are read while the versions are being fetched, and matched as raw bytes,
+        since the specifiers being edited are ASCII. Scan results are cached by file
+        mtime and size, so a dry run skips reading files unchanged since the last run.
+        Real updates always read the files, since an edit can keep both unchanged.
+
         Returns:
             The number of updates applied or that would be applied in dry-run mode.
         """
         update_count = 0
-
-        for package in PYPI_PACKAGES:
-            version = get_pypi_version(package)
-            if not version:
-                logger.warning("Failed to fetch version for %s", package)
-                continue
+        versions: dict[str, str] = {}
+        cached_scans = read_scan_cache(PYPI_PACKAGES) if dry_run else {}
+        # Only the files of this run are written back, so stale paths drop out of the cache
+        scans: dict[str, Any] = {}
+        keys = {filepath: str(filepath.resolve()) for filepath in self.files}
+        contents: dict[Path, bytes] = {}
+        found: dict[Path, dict[str, list[str]]] = {}
+
+        # Scan the files while the version fetches are in flight
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pending = {package: executor.submit(get_pypi_version, package) for package in PYPI_PACKAGES}
 
             for filepath in self.files:
-                if not filepath.exists():
-                    continue
-
-                if dry_run:
-                    if self._matches(filepath, package):
-                        logger.info("%s: %s -> %s", filepath, package, version)
-                        update_count += 1
-                elif self._update_file(filepath, package, version):
-                    logger.info("%s: %s -> %s", filepath, package, version)
-                    update_count += 1
+                key = keys[filepath]
+                stat = filepath.stat()
+                cached = cached_scans.get(key)
+                if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+                    found[filepath] = cached[2]
+                    scans[key] = cached
+                else:
+                    contents[filepath] = filepath.read_bytes()
+                    found[filepath] = self._scan(contents[filepath])
+                    scans[key] = [stat.st_mtime_ns, stat.st_size, found[filepath]]
+
+            for package, future in pending.items():
+                version = future.result()
+                if version:
+                    versions[package] = version
+                else:
+                    logger.warning("Failed to fetch version for %s", package)
 
+        for filepath in self.files:
+            packages = self._outdated(found[filepath], versions)
+            if packages and not dry_run:
+                content, packages = self._update_content(contents[filepath], versions)
+                if packages:
+                    filepath.write_bytes(content)
+                stat = filepath.stat()
+                scans[keys[filepath]] = [stat.st_mtime_ns, stat.st_size, self._scan(content)]
+
+            for package in packages:
+                logger.info("%s: %s -> %s", filepath, package, versions[package])
+            update_count += len(packages)
+
+        write_scan_cache(PYPI_PACKAGES, scans)
         return update_count
 
 
 class ActionYmlUpdater:
     """Updates uv version in action.yml files."""
 
-    PATTERN = (
-        r'(uv-version:\s*\n\s*description:[^\n]*\n\s*required:[^\n]*\n\s*default:\s*")'
-        r'[0-9]+\.[0-9]+\.[0-9]+(")'
+    PATTERN = re.compile(
+        rb'(uv-version:\s*\n\s*description:[^\n]*\n\s*required:[^\n]*\n\s*default:\s*")'
+        rb'([0-9]+\.[0-9]+\.[0-9]+)(")'
     )
 
     def __init__(self, files: list[Path]) -> None:
-        self.files = files
-
-    @staticmethod
-    def _build_replacement(version: str) -> str:
-        return rf"\g<1>{version}\2"
+        self.files = [filepath for filepath in files if filepath.exists()]
 
-    def _update_file(self, filepath: Path, version: str) -> bool:
-        """Update uv version in an action.yml file.
+    def _update_content(self, content: bytes, version: str) -> tuple[bytes, bool]:
+        """Update uv version in action.yml content.
 
         Returns:
-            True if the file was updated, False otherwise.
+            A tuple of (new_content, updated) where updated is True if a matched version differs from `version`.
         """
-        content = filepath.read_text()
-        replacement = self._build_replacement(version)
-        new_content, count = re.subn(self.PATTERN, replacement, content)
+        encoded = version.encode()
+        updated = False
 
-        if count > 0 and new_content != content:
-            filepath.write_text(new_content)
-            return True
-        return False
+        def replace(match: re.Match[bytes]) -> bytes:
+            nonlocal updated
+            prefix, current, suffix = match.groups()
+            updated = updated or current != encoded
+            return prefix + encoded + suffix
 
-    def _matches(self, filepath: Path) -> bool:
-        """Check if file contains the uv version pattern.
-
-        Returns:
-            True if the uv version pattern is found in the file, False otherwise.
-        """
-        content = filepath.read_text()
-        return bool(re.search(self.PATTERN, content))
+        new_content = self.PATTERN.sub(replace, content)
+        return new_content, updated
 
     def update(self, *, dry_run: bool = False) -> int:
         """Update all action.yml files.
@@ -140,16 +186,13 @@ class ActionYmlUpdater:
         update_count = 0
 
         for filepath in self.files:
-            if not filepath.exists():
+            content, updated = self._update_content(filepath.read_bytes(), version)
+            if not updated:
                 continue
-
-            if dry_run:
-                if self._matches(filepath):
-                    logger.info("%s: uv -> %s", filepath, version)
-                    update_count += 1
-            elif self._update_file(filepath, version):
-                logger.info("%s: uv -> %s", filepath, version)
-                update_count += 1
+            if not dry_run:
+                filepath.write_bytes(content)
+            logger.info("%s: uv -> %s", filepath, version)
+            update_count += 1
 
         return update_count
 
@@ -161,71 +204,63 @@ class PreCommitConfigUpdater:
         self.config_file = config_file
 
     @staticmethod
-    def _build_pattern(repo_url: str) -> str:
-        return rf'(- repo: {re.escape(repo_url)}\s*\n\s*rev:\s*")[^"]+(")'
-
-    @staticmethod
-    def _build_replacement(version: str) -> str:
-        return rf"\g<1>v{version}\2"
+    @cache
+    def _build_pattern(repo_urls: tuple[str, ...]) -> re.Pattern[bytes]:
+        alternation = b"|".join(re.escape(repo_url.encode()) for repo_url in repo_urls)
+        return re.compile(rb"(- repo: (" + alternation + rb')\s*\n\s*rev:\s*")([^"]+)(")')
 
     @staticmethod
     def _extract_hook_name(repo_url: str) -> str:
         return repo_url.split("/")[-1]
 
-    def _update_hook(self, content: str, repo_url: str, version: str) -> tuple[str, bool]:
-        """Update a single hook in prek config.
+    def _update_content(self, content: bytes, versions: dict[str, str]) -> tuple[bytes, list[str]]:
+        """Update every hook in prek config content in a single regex pass.
 
         Returns:
-            A tuple of (new_content, updated) where updated is True if changes were made.
+            A tuple of (new_content, updated_repo_urls) listing the hooks whose revision changed.
         """
-        pattern = self._build_pattern(repo_url)
-        replacement = self._build_replacement(version)
-        new_content, count = re.subn(pattern, replacement, content)
+        revs = {repo_url.encode(): f"v{version}".encode() for repo_url, version in versions.items()}
+        updated: list[str] = []
 
-        if count > 0 and new_content != content:
-            return new_content, True
-        return content, False
+        def replace(match: re.Match[bytes]) -> bytes:
+            prefix, repo_url, current, suffix = match.groups()
+            rev = revs[repo_url]
+            if current != rev and repo_url.decode() not in updated:
+                updated.append(repo_url.decode())
+            return prefix + rev + suffix
 
-    def _matches(self, content: str, repo_url: str) -> bool:
-        """Check if content contains the hook pattern.
-
-        Returns:
-            True if the hook pattern is found in the content, False otherwise.
-        """
-        return bool(re.search(self._build_pattern(repo_url), content))
+        new_content = self._build_pattern(tuple(versions)).sub(replace, content)
+        return new_content, updated
 
     def update(self, *, dry_run: bool = False) -> int:
         """Update prek config.
 
+        The config is scanned once for all hooks, whose versions are fetched up front.
+
         Returns:
             The number of updates applied or that would be applied in dry-run mode.
         """
         if not self.config_file.exists():
             return 0
 
-        update_count = 0
-        content = self.config_file.read_text()
+        fetched = get_github_tags_batch(tuple(github_repo for _, github_repo in PREK_HOOKS))
+        versions: dict[str, str] = {}
 
         for repo_url, github_repo in PREK_HOOKS:
-            version = get_github_tag(github_repo)
-            if not version:
+            version = fetched[github_repo]
+            if version:
+                versions[repo_url] = version
+            else:
                 logger.warning("Failed to fetch version for %s", github_repo)
-                continue
 
-            hook_name = self._extract_hook_name(repo_url)
+        if not versions:
+            return 0
 
-            if dry_run:
-                if self._matches(content, repo_url):
-                    logger.info("%s: %s -> v%s", self.config_file, hook_name, version)
-                    update_count += 1
-            else:
-                new_content, updated = self._update_hook(content, repo_url, version)
-                if updated:
-                    content = new_content
-                    logger.info("%s: %s -> v%s", self.config_file, hook_name, version)
-                    update_count += 1
+        content, repo_urls = self._update_content(self.config_file.read_bytes(), versions)
+        if repo_urls and not dry_run:
+            self.config_file.write_bytes(content)
 
-        if not dry_run and update_count > 0:
-            self.config_file.write_text(content)
+        for repo_url in repo_urls:
+            logger.info("%s: %s -> v%s", self.config_file, self._extract_hook_name(repo_url), versions[repo_url])
 
-        return update_count
+        return len(repo_urls)
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-import os
+import sys
 from pathlib import Path
 
+from cookiecutter.exceptions import CookiecutterException
+from cookiecutter.main import cookiecutter
+
 
 def main() -> None:
     """Execute cookiecutter using the package directory as the template source.
 
     This function determines the package directory location relative to this module
-    and invokes cookiecutter with that directory as the template.
+    and invokes cookiecutter with that directory as the template. The cookiecutter
+    Python API is called in-process, and its errors are reported as a one-line
+    message with exit code 1, as the cookiecutter command does.
     """
     cwd = Path(__file__).parent
     package_dir = (cwd / "..").resolve()
-    os.system(f"cookiecutter {package_dir}")  # noqa: S605 | No injection, retrieving path in OS
+    try:
+        cookiecutter(str(package_dir))
+    except CookiecutterException as e:
+        print(e)
+        sys.exit(1)
@@ -11,13 +11,61 @@ with user-provided cookiecutter variables that have been validated.
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
-import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
+import string
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+    from subprocess import CompletedProcess  # noqa: S404
+
+# subprocess and concurrent.futures are only needed by the optional GitHub setup, so
+# they are imported where they are used
 
 PROJECT_DIRECTORY = Path.cwd()
 
+# Template choices, rendered into literals by cookiecutter and evaluated once
+INCLUDE_GITHUB_ACTIONS = "{{cookiecutter.include_github_actions}}" == "y"
+PUBLISH_TO_PYPI = "{{cookiecutter.publish_to_pypi}}" == "y"
+INCLUDE_MKDOCS = "{{cookiecutter.mkdocs}}" == "y"
+INCLUDE_CODECOV = "{{cookiecutter.codecov}}" == "y"
+INCLUDE_DOCKERFILE = "{{cookiecutter.dockerfile}}" == "y"
+INCLUDE_DEVCONTAINER = "{{cookiecutter.devcontainer}}" == "y"
+LICENSE_CHOICE = "{{cookiecutter.open_source_license}}"
+LAYOUT = "{{cookiecutter.layout}}"
+AUTOMATE_GITHUB_SETUP = "{{cookiecutter.automate_github_setup}}" == "y"
+DRY_RUN_GITHUB_SETUP = "{{cookiecutter.dry_run_github_setup}}" == "y"
+
+# Set COOKIECUTTER_VERBOSE=1 to show progress before each command and captured command output
+VERBOSE = os.environ.get("COOKIECUTTER_VERBOSE") == "1"
+
+# Maps each open source license choice to its template file
+LICENSE_FILES = {
+    "MIT license": "LICENSE_MIT",
+    "BSD license": "LICENSE_BSD",
+    "ISC license": "LICENSE_ISC",
+    "Apache Software License 2.0": "LICENSE_APACHE",
+    "GNU General Public License v3": "LICENSE_GPL",
+}
+
+# Matches, in order: the requires-python specifier, a specific Python 3.x
+# classifier, and the generic Python 3 classifier
+PYPROJECT_PYTHON_PATTERN = re.compile(
+    r'(requires-python = ">=\d+\.\d+,<\d+\.\d+")'
+    r'|("Programming Language :: Python :: 3\.\d+",?\n)'
+    r'|("Programming Language :: Python :: 3",)'
+)
+ACTION_PYTHON_DEFAULT_PATTERN = re.compile(r'default: "\d+\.\d+"')
+# Deletes every character GitHub allows in repository names; anything left over is invalid
+REPOSITORY_NAME_DELETIONS = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
+
+# Output that hook runners print when a hook rewrote files during a commit
+HOOK_MODIFIED_MARKERS = ("files were modified by this hook", "reformatted")
+
 
 def remove_file(filepath: str) -> None:
     """Remove a file from the generated project.
@@ -47,16 +95,6 @@ def move_file(filepath: str, target: str) -> None:
     (PROJECT_DIRECTORY / filepath).rename(PROJECT_DIRECTORY / target)
 
 
-def move_dir(src: str, target: str) -> None:
-    """Move a directory in the generated project.
-
-    Args:
-        src: Relative path to the source directory
-        target: Relative path to the target location
-    """
-    shutil.move(str(PROJECT_DIRECTORY / src), str(PROJECT_DIRECTORY / target))
-
-
 def get_python_version() -> str:
     """Get selected Python version from cookiecutter config.
 
@@ -68,53 +106,70 @@ def get_python_version() -> str:
 
 def update_python_version_in_file(filepath: Path, python_version: str) -> None:
     """Update Python version in pyproject.toml."""
-    content = filepath.read_text()
 
-    # Update requires-python
-    content = re.sub(
-        r'requires-python = ">=\d+\.\d+,<\d+\.\d+"',
-        f'requires-python = ">={python_version},<4.0"',
-        content,
-    )
+    def replace(match: re.Match[str]) -> str:
+        if match.group(1):
+            # Update requires-python
+            return f'requires-python = ">={python_version},<4.0"'
+        if match.group(2):
+            # Remove all specific Python version classifiers
+            return ""
+        # Add back the current version classifier
+        return f'{match.group(3)}\n    "Programming Language :: Python :: {python_version}",'
+
+    filepath.write_text(PYPROJECT_PYTHON_PATTERN.sub(replace, filepath.read_text()))
 
-    # Remove all specific Python version classifiers
-    content = re.sub(
-        r'"Programming Language :: Python :: 3\.\d+",?\n',
-        "",
-        content,
-    )
 
-    # Add back the current version classifier
-    content = re.sub(
-        r'("Programming Language :: Python :: 3",)',
-        f'\\1\n    "Programming Language :: Python :: {python_version}",',
+def update_github_action_python_version(python_version: str) -> None:
+    """Update default Python version in GitHub Actions setup."""
+    action_file = PROJECT_DIRECTORY / ".github" / "actions" / "setup-python-env" / "action.yml"
+    try:
+        content = action_file.read_text()
+    except FileNotFoundError:
+        return
+    content = ACTION_PYTHON_DEFAULT_PATTERN.sub(
+        f'default: "{python_version}"',
         content,
+        count=1,  # Only update first occurrence (python-version)
     )
+    action_file.write_text(content)
 
-    filepath.write_text(content)
 
+def list_root_entries() -> set[str]:
+    """List the names of the entries in the generated project's root directory.
+
+    Returns:
+        Set of file and directory names, read with a single directory scan
+    """
+    with os.scandir(PROJECT_DIRECTORY) as entries:
+        return {entry.name for entry in entries}
+
+
+def prune_workflows(workflows: Mapping[str, bool]) -> None:
+    """Remove unwanted GitHub Actions workflows with a single directory scan.
+
+    Args:
+        workflows: Whether to keep each optional workflow, by file name;
+            workflows that are not listed are kept
+    """
+    workflows_dir = PROJECT_DIRECTORY / ".github" / "workflows"
+    with os.scandir(workflows_dir) as entries:
+        unwanted = [entry.name for entry in entries if not workflows.get(entry.name, True)]
+    for name in unwanted:
+        (workflows_dir / name).unlink()
 
-def update_github_action_python_version(python_version: str) -> None:
-    """Update default Python version in GitHub Actions setup."""
-    action_file = Path(PROJECT_DIRECTORY) / ".github" / "actions" / "setup-python-env" / "action.yml"
-    if action_file.exists():
-        content = action_file.read_text()
-        content = re.sub(
-            r'default: "\d+\.\d+"',
-            f'default: "{python_version}"',
-            content,
-            count=1,  # Only update first occurrence (python-version)
-        )
-        action_file.write_text(content)
 
+def remove_tox_ini(root_entries: Collection[str]) -> None:
+    """Remove tox.ini from generated project.
 
-def remove_tox_ini() -> None:
-    """Remove tox.ini from generated project."""
-    tox_file = Path(PROJECT_DIRECTORY) / "tox.ini"
-    if tox_file.exists():
-        tox_file.unlink()
+    Args:
+        root_entries: Names of the entries in the project root
+    """
+    if "tox.ini" in root_entries:
+        remove_file("tox.ini")
 
 
+@cache
 def check_command_exists(command: str) -> bool:
     """Check if a command exists in the system PATH.
 
@@ -134,7 +189,7 @@ def run_command(
     check: bool = True,
     capture_output: bool = False,
     dry_run: bool = False,
-) -> subprocess.CompletedProcess | None:
+) -> CompletedProcess | None:
     """Run a command and provide feedback to the user.
 
     Args:
@@ -150,14 +205,14 @@ def run_command(
     Raises:
         CalledProcessError: If command fails and check=True
     """
-    cmd_str = " ".join(cmd)
+    import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
 
     if dry_run:
-        print(f"[DRY RUN] {description}")
-        print(f"          Would run: {cmd_str}")
+        print(f"[DRY RUN] {description}\n          Would run: {' '.join(cmd)}")
         return None
 
-    print(f"🚀 {description}...")
+    if VERBOSE:
+        print(f"🚀 {description}...")
     try:
         result = subprocess.run(  # noqa: S603  # Controlled execution in hook with validated cookiecutter variables
             cmd,
@@ -168,7 +223,7 @@ def run_command(
         )
         if result.returncode == 0:
             print(f"✅ {description} completed successfully")
-        if not capture_output and result.stdout:
+        if VERBOSE and capture_output and result.stdout:
             print(result.stdout)
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed with exit code {e.returncode}")
@@ -179,17 +234,20 @@ def run_command(
         return result
 
 
+@cache
 def check_gh_auth() -> bool:
     """Check if GitHub CLI is authenticated.
 
     Returns:
         True if gh is authenticated, False otherwise
     """
+    import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
+
     try:
         result = subprocess.run(  # Controlled gh CLI invocation
             ["gh", "auth", "status"],  # noqa: S607  # gh is a standard CLI tool
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -204,24 +262,29 @@ def check_git_config() -> tuple[bool, str]:
     Returns:
         Tuple of (is_configured, error_message)
     """
+    import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
+
     try:
-        name_result = subprocess.run(  # Controlled git config read
+        # Start both lookups before waiting on either
+        name_proc = subprocess.Popen(  # Controlled git config read
             ["git", "config", "user.name"],  # noqa: S607  # git is a standard CLI tool
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
         )
-        email_result = subprocess.run(  # Controlled git config read
+        email_proc = subprocess.Popen(  # Controlled git config read
             ["git", "config", "user.email"],  # noqa: S607  # git is a standard CLI tool
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
         )
+        name_stdout, _ = name_proc.communicate()
+        email_stdout, _ = email_proc.communicate()
 
         missing = []
-        if name_result.returncode != 0 or not name_result.stdout.strip():
+        if name_proc.returncode != 0 or not name_stdout.strip():
             missing.append("user.name")
-        if email_result.returncode != 0 or not email_result.stdout.strip():
+        if email_proc.returncode != 0 or not email_stdout.strip():
             missing.append("user.email")
 
         if missing:
@@ -244,6 +307,8 @@ def check_git_connectivity(protocol: str) -> tuple[bool, str]:
     Returns:
         Tuple of (can_connect, error_message)
     """
+    import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
+
     try:
         if protocol == "ssh":
             # Test SSH connection to GitHub
@@ -260,11 +325,12 @@ def check_git_connectivity(protocol: str) -> tuple[bool, str]:
                 return True, ""
             return False, "SSH connection to GitHub failed. Ensure SSH keys are configured."
 
-        # https - check if credential helper is configured
+        # https - check if credential helper is configured; only its presence matters,
+        # so the output is left undecoded
         result = subprocess.run(  # Controlled git config read
             ["git", "config", "--get", "credential.helper"],  # noqa: S607  # git is a standard CLI tool
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
         if result.returncode == 0 and result.stdout.strip():
@@ -278,6 +344,22 @@ def check_git_connectivity(protocol: str) -> tuple[bool, str]:
         return False, "Git credential helper not configured for HTTPS. You may be prompted for credentials."
 
 
+def hooks_may_have_modified_files(result: CompletedProcess | None) -> bool:
+    """Check whether commit hooks may have left modified files behind.
+
+    Args:
+        result: Result of the commit, with captured output
+
+    Returns:
+        False if the commit succeeded without any hook reporting modified files,
+        True otherwise
+    """
+    if result is None or result.returncode != 0:
+        return True
+    output = f"{result.stdout}{result.stderr}".lower()
+    return any(marker in output for marker in HOOK_MODIFIED_MARKERS)
+
+
 def validate_repository_name(name: str) -> tuple[bool, str]:
     """Validate repository name meets GitHub requirements.
 
@@ -287,8 +369,6 @@ def validate_repository_name(name: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    import re
-
     if not name:
         return False, "Repository name cannot be empty"
 
@@ -301,7 +381,7 @@ def validate_repository_name(name: str) -> tuple[bool, str]:
         return False, "Repository name cannot start with a period"
 
     # Check for invalid characters
-    if not re.match(r"^[a-zA-Z0-9._-]+$", name):
+    if name.translate(REPOSITORY_NAME_DELETIONS):
         return False, "Repository name contains invalid characters (only alphanumeric, -, _, . allowed)"
 
     return True, ""
@@ -316,6 +396,9 @@ def setup_github_repository(*, dry_run: bool = False) -> bool:  # noqa: C901  #
     Returns:
         True if setup was successful, False otherwise
     """
+    import subprocess  # noqa: S404  # Controlled execution in cookiecutter hook context
+    from concurrent.futures import ThreadPoolExecutor
+
     project_name = "{{cookiecutter.project_name}}"
     author_handle = "{{cookiecutter.author_github_handle}}"
     protocol = "{{cookiecutter.git_remote_protocol}}"
@@ -338,7 +421,7 @@ def setup_github_repository(*, dry_run: bool = False) -> bool:  # noqa: C901  #
             return False
 
         # Check if git repo already exists
-        if Path(PROJECT_DIRECTORY, ".git").exists():
+        if (PROJECT_DIRECTORY / ".git").exists():
             print("❌ Git repository already initialized in this directory")
             print("   This may conflict with the automation")
             print("   Please run the setup commands manually from the README")
@@ -355,14 +438,21 @@ def setup_github_repository(*, dry_run: bool = False) -> bool:  # noqa: C901  #
             print("   Install git first, then run setup commands manually from the README")
             return False
 
-        if not check_gh_auth():
+        # gh auth and git config are quick local checks, so run them concurrently. The
+        # connectivity probe contacts GitHub and may block until its timeout, so it only
+        # starts once both have passed
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gh_auth_future = executor.submit(check_gh_auth)
+            git_config_future = executor.submit(check_git_config)
+
+        if not gh_auth_future.result():
             print("❌ GitHub CLI is not authenticated")
             print("   Run: gh auth login")
             print("   Then run the setup commands manually from the README")
             return False
 
         # Check git configuration
-        config_ok, config_error = check_git_config()
+        config_ok, config_error = git_config_future.result()
         if not config_ok:
             print(f"❌ {config_error}")
             print("   Configure with:")
@@ -458,18 +548,19 @@ def setup_github_repository(*, dry_run: bool = False) -> bool:  # noqa: C901  #
         # Check if prek modified any files
         if dry_run:
             print("[DRY RUN] Checking if prek modified files")
-            print("          Would run: git status --porcelain")
+            print("          Would run: git --no-optional-locks status --porcelain=v2 -z")
             print("[DRY RUN] If files were modified, would stage and commit again")
-        else:
+        elif hooks_may_have_modified_files(result):
+            # Only emptiness matters, so skip decoding and git's optional index lock
             status_result = subprocess.run(  # Controlled git status check
-                ["git", "status", "--porcelain"],  # noqa: S607  # git is a standard CLI tool
+                ["git", "--no-optional-locks", "status", "--porcelain=v2", "-z"],  # noqa: S607  # git is a standard CLI tool
                 cwd=PROJECT_DIRECTORY,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
-            if status_result.stdout.strip():
+            if status_result.stdout:
                 print("🔧 Prek hooks modified files, committing changes...")
                 run_command(
                     ["git", "add", "."],
@@ -536,83 +627,55 @@ def setup_github_repository(*, dry_run: bool = False) -> bool:  # noqa: C901  #
 
 
 if __name__ == "__main__":
+    # Snapshot the project root once instead of stat-ing each optional file
+    root_entries = list_root_entries()
+
     # Update Python version to match current environment
     python_version = get_python_version()
-    update_python_version_in_file(Path(PROJECT_DIRECTORY) / "pyproject.toml", python_version)
-    update_github_action_python_version(python_version)
+    update_python_version_in_file(PROJECT_DIRECTORY / "pyproject.toml", python_version)
 
     # Remove tox.ini (not needed for web apps)
-    remove_tox_ini()
+    remove_tox_ini(root_entries)
 
-    if "{{cookiecutter.include_github_actions}}" != "y":
+    if not INCLUDE_GITHUB_ACTIONS:
         remove_dir(".github")
     else:
-        if "{{cookiecutter.mkdocs}}" != "y" and "{{cookiecutter.publish_to_pypi}}" == "n":
-            remove_file(".github/workflows/on-release-main.yml")
-
-    if "{{cookiecutter.mkdocs}}" != "y":
+        update_github_action_python_version(python_version)
+        workflows = {
+            "on-release-main.yml": INCLUDE_MKDOCS or PUBLISH_TO_PYPI,
+            "validate-codecov-config.yml": INCLUDE_CODECOV,
+        }
+        if not all(workflows.values()):
+            prune_workflows(workflows)
+
+    if not INCLUDE_MKDOCS:
         remove_dir("docs")
         remove_file("mkdocs.yml")
 
-    if "{{cookiecutter.dockerfile}}" != "y":
+    if not INCLUDE_DOCKERFILE:
         remove_file("Dockerfile")
 
-    if "{{cookiecutter.codecov}}" != "y":
+    if not INCLUDE_CODECOV:
         remove_file("codecov.yaml")
-        if "{{cookiecutter.include_github_actions}}" == "y":
-            remove_file(".github/workflows/validate-codecov-config.yml")
 
-    if "{{cookiecutter.devcontainer}}" != "y":
+    if not INCLUDE_DEVCONTAINER:
         remove_dir(".devcontainer")
 
-    if "{{cookiecutter.open_source_license}}" == "MIT license":
-        move_file("LICENSE_MIT", "LICENSE")
-        remove_file("LICENSE_BSD")
-        remove_file("LICENSE_ISC")
-        remove_file("LICENSE_APACHE")
-        remove_file("LICENSE_GPL")
-
-    if "{{cookiecutter.open_source_license}}" == "BSD license":
-        move_file("LICENSE_BSD", "LICENSE")
-        remove_file("LICENSE_MIT")
-        remove_file("LICENSE_ISC")
-        remove_file("LICENSE_APACHE")
-        remove_file("LICENSE_GPL")
-
-    if "{{cookiecutter.open_source_license}}" == "ISC license":
-        move_file("LICENSE_ISC", "LICENSE")
-        remove_file("LICENSE_MIT")
-        remove_file("LICENSE_BSD")
-        remove_file("LICENSE_APACHE")
-        remove_file("LICENSE_GPL")
-
-    if "{{cookiecutter.open_source_license}}" == "Apache Software License 2.0":
-        move_file("LICENSE_APACHE", "LICENSE")
-        remove_file("LICENSE_MIT")
-        remove_file("LICENSE_BSD")
-        remove_file("LICENSE_ISC")
-        remove_file("LICENSE_GPL")
-
-    if "{{cookiecutter.open_source_license}}" == "GNU General Public License v3":
-        move_file("LICENSE_GPL", "LICENSE")
-        remove_file("LICENSE_MIT")
-        remove_file("LICENSE_BSD")
-        remove_file("LICENSE_ISC")
-        remove_file("LICENSE_APACHE")
-
-    if "{{cookiecutter.open_source_license}}" == "Not open source":
-        remove_file("LICENSE_GPL")
-        remove_file("LICENSE_MIT")
-        remove_file("LICENSE_BSD")
-        remove_file("LICENSE_ISC")
-        remove_file("LICENSE_APACHE")
-
-    if "{{cookiecutter.layout}}" == "src":
-        if Path("src").is_dir():
+    chosen_license = LICENSE_FILES.get(LICENSE_CHOICE)
+    if chosen_license:
+        move_file(chosen_license, "LICENSE")
+    for license_file in LICENSE_FILES.values():
+        if license_file != chosen_license and license_file in root_entries:
+            remove_file(license_file)
+
+    if LAYOUT == "src":
+        src_dir = PROJECT_DIRECTORY / "src"
+        if "src" in root_entries:
             remove_dir("src")
-        move_dir("{{cookiecutter.project_slug}}", str(Path("src") / "{{cookiecutter.project_slug}}"))
+        # Both paths are inside the project directory, so a plain rename suffices
+        src_dir.mkdir()
+        (PROJECT_DIRECTORY / "{{cookiecutter.project_slug}}").rename(src_dir / "{{cookiecutter.project_slug}}")
 
     # Run automated GitHub setup if requested
-    if "{{cookiecutter.automate_github_setup}}" == "y":
-        dry_run = "{{cookiecutter.dry_run_github_setup}}" == "y"
-        setup_github_repository(dry_run=dry_run)
+    if AUTOMATE_GITHUB_SETUP:
+        setup_github_repository(dry_run=DRY_RUN_GITHUB_SETUP)
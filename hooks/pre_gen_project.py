@@ -32,19 +32,30 @@ if not re.match(PROJECT_SLUG_REGEX, project_slug):
     # Exit to cancel project
     sys.exit(1)
 
-# Validate Python version is available via uv
 python_version = "{{cookiecutter.python_version}}"
+
+# The interpreter running cookiecutter already provides the requested version,
+# so there is no need to ask uv
+major, minor = (int(part) for part in python_version.split("."))
+if sys.version_info[:2] == (major, minor):
+    print(f"✓ Using Python {python_version} (current interpreter)")
+    sys.exit(0)
+
+# Validate Python version is available via uv
 try:
     result = subprocess.run(  # Controlled uv command invocation
         ["uv", "python", "list"],  # noqa: S607  # uv is a standard Python package manager
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
         check=True,
     )
     installed_versions = result.stdout
 
-    # Check if the requested version is installed
-    if python_version not in installed_versions:
+    # Check if the requested version is installed; match whole "cpython-X.Y." entries
+    # so that e.g. 3.1 is not satisfied by 3.10
+    installed_pattern = re.compile(rf"^\S*cpython-{re.escape(python_version)}\.\d", re.MULTILINE)
+    if not installed_pattern.search(installed_versions):
         print(f"\nERROR: Python {python_version} is not installed via uv.")
         print(f"\nTo install Python {python_version}, run:")
         print(f"  uv python install {python_version}")
@@ -2,18 +2,54 @@
 
 from __future__ import annotations
 
+import gzip
+import os
 import shutil
+from email.message import Message
+from functools import partial
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 import pytest
 
-from cookiecutter_uv.cicd.fetchers import GitHubRepo, get_github_release, get_github_tag, get_pypi_version
+from cookiecutter_uv.cicd import cache
+from cookiecutter_uv.cicd.fetchers import (
+    GitHubRepo,
+    _fetch_json,
+    _http_request,
+    _parse_json,
+    _Response,
+    fetch_all_versions,
+    get_github_release,
+    get_github_tag,
+    get_github_tags_batch,
+    get_pypi_version,
+)
 from cookiecutter_uv.cicd.updaters import ActionYmlUpdater, PreCommitConfigUpdater, PyprojectTomlUpdater
 
 DATA_DIR = Path(__file__).parent / "data" / "cicd"
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the response cache at a temp directory.
+
+    Returns:
+        Path: Path to the temporary cache directory.
+    """
+    path = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clear_fetcher_caches() -> None:
+    """Forget versions memoized by earlier tests."""
+    for fetcher in (get_pypi_version, get_github_release, get_github_tag, get_github_tags_batch):
+        fetcher.cache_clear()
+
+
 @pytest.fixture
 def temp_pyproject(tmp_path: Path) -> Path:
     """Copy sample pyproject.toml to temp directory.
@@ -55,6 +91,9 @@ class TestGitHubRepo:
         repo = GitHubRepo(owner="astral-sh", repo="uv")
         assert str(repo) == "astral-sh/uv"
 
+    def test_hashable(self) -> None:
+        assert {GitHubRepo("astral-sh", "uv"): 1}[GitHubRepo("astral-sh", "uv")] == 1
+
 
 class TestFetchers:
     def test_get_pypi_version_returns_version(self) -> None:
@@ -76,6 +115,128 @@ class TestFetchers:
         with patch("cookiecutter_uv.cicd.fetchers._fetch_json", return_value=mock_response):
             assert get_github_tag(GitHubRepo("pre-commit", "pre-commit-hooks")) == "5.0.0"
 
+    def test_get_pypi_version_is_memoized(self) -> None:
+        mock_response = {"info": {"version": "1.2.3"}}
+        with patch("cookiecutter_uv.cicd.fetchers._fetch_json", return_value=mock_response) as mock:
+            get_pypi_version("pytest")
+            get_pypi_version("pytest")
+
+        mock.assert_called_once()
+
+    def test_fetch_all_versions_maps_keys_to_versions(self) -> None:
+        versions = {"pytest": "8.0.0", "ruff": None}
+        assert fetch_all_versions(versions.get, ["pytest", "ruff"]) == versions
+
+    def test_fetch_all_versions_empty(self) -> None:
+        assert fetch_all_versions(get_pypi_version, []) == {}
+
+
+class TestCache:
+    def test_write_then_read(self) -> None:
+        cache.write_cache("https://example.com", {"version": "1.0.0"}, '"abc"')
+
+        entry = cache.read_cache("https://example.com")
+        assert entry == cache.CacheEntry(body={"version": "1.0.0"}, etag='"abc"', fresh=True)
+
+    def test_stale_entry_is_not_fresh(self) -> None:
+        cache.write_cache("https://example.com", {"version": "1.0.0"})
+
+        entry = cache.read_cache("https://example.com", ttl=-1)
+        assert entry is not None
+        assert not entry.fresh
+
+    def test_missing_entry(self) -> None:
+        assert cache.read_cache("https://example.com") is None
+
+
+class TestGetGitHubTagsBatch:
+    REPOS = (GitHubRepo("pre-commit", "pre-commit-hooks"), GitHubRepo("astral-sh", "ruff-pre-commit"))
+
+    def test_single_graphql_query(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        mock_response = {"data": {"r0": {"refs": {"nodes": [{"name": "v6.0.0"}]}}, "r1": None}}
+        with patch("cookiecutter_uv.cicd.fetchers._post_json", return_value=mock_response) as mock:
+            versions = get_github_tags_batch(self.REPOS)
+
+        mock.assert_called_once()
+        assert versions == {self.REPOS[0]: "6.0.0", self.REPOS[1]: None}
+
+    def test_repeated_query_is_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        mock_response = {"data": {"r0": None, "r1": None}}
+        with patch("cookiecutter_uv.cicd.fetchers._post_json", return_value=mock_response) as mock:
+            get_github_tags_batch(self.REPOS)
+            get_github_tags_batch(self.REPOS)
+
+        mock.assert_called_once()
+
+    def test_falls_back_to_rest_without_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with (
+            patch("cookiecutter_uv.cicd.fetchers._post_json") as mock_post,
+            patch("cookiecutter_uv.cicd.fetchers.get_github_tag", return_value="1.0.0"),
+        ):
+            versions = get_github_tags_batch(self.REPOS)
+
+        mock_post.assert_not_called()
+        assert versions == dict.fromkeys(self.REPOS, "1.0.0")
+
+
+class TestFetchJson:
+    URL = "https://api.github.com/repos/astral-sh/uv/tags"
+
+    def test_caches_response_with_etag(self) -> None:
+        response = _Response(200, b"[]", '"abc"')
+        with patch("cookiecutter_uv.cicd.fetchers._http_request", return_value=response) as mock:
+            assert _fetch_json(self.URL) == []
+            assert _fetch_json(self.URL) == []
+
+        mock.assert_called_once()
+        entry = cache.read_cache(self.URL)
+        assert entry is not None
+        assert entry.etag == '"abc"'
+
+    def test_not_modified_returns_cached_body(self) -> None:
+        cache.write_cache(self.URL, [{"name": "v1.0.0"}], '"abc"')
+
+        with (
+            patch("cookiecutter_uv.cicd.fetchers.read_cache", partial(cache.read_cache, ttl=-1)),
+            patch("cookiecutter_uv.cicd.fetchers._http_request", return_value=_Response(304, b"")) as mock,
+        ):
+            assert _fetch_json(self.URL) == [{"name": "v1.0.0"}]
+
+        mock.assert_called_once_with(self.URL, {"If-None-Match": '"abc"'})
+
+    def test_error_status_returns_none(self) -> None:
+        with patch("cookiecutter_uv.cicd.fetchers._http_request", return_value=_Response(404, b"")):
+            assert _fetch_json(self.URL) is None
+        assert cache.read_cache(self.URL) is None
+
+    def test_invalid_json_returns_none(self) -> None:
+        assert _parse_json(_Response(200, b"not json")) is None
+
+    def test_urllib_fallback_maps_http_errors_to_status(self) -> None:
+        not_modified = HTTPError(self.URL, 304, "Not Modified", Message(), None)
+        with (
+            patch("cookiecutter_uv.cicd.fetchers.HAS_HTTPX", new=False),
+            patch("cookiecutter_uv.cicd.fetchers.urlopen", side_effect=not_modified),
+        ):
+            assert _http_request(self.URL, {}) == _Response(304, b"")
+
+    def test_urllib_fallback_requests_and_decodes_gzip(self) -> None:
+        response = MagicMock(status=200, headers={"Content-Encoding": "gzip"})
+        response.read.return_value = gzip.compress(b"[]")
+        response.__enter__.return_value = response
+        with (
+            patch("cookiecutter_uv.cicd.fetchers.HAS_HTTPX", new=False),
+            patch("cookiecutter_uv.cicd.fetchers.urlopen", return_value=response) as mock,
+        ):
+            assert _http_request(self.URL, {}) == _Response(200, b"[]")
+
+        request = mock.call_args.args[0]
+        assert request.get_header("Accept-encoding") == "gzip"
+        assert request.get_header("Accept") == "application/vnd.github+json"
+
 
 class TestPyprojectTomlUpdater:
     def test_updates_package_version(self, temp_pyproject: Path) -> None:
@@ -100,16 +261,98 @@ class TestPyprojectTomlUpdater:
         content = temp_pyproject.read_text()
         assert '"mkdocstrings[python]>=0.30.0"' in content
 
+    def test_updates_multiple_packages(self, temp_pyproject: Path) -> None:
+        versions = {"pytest": "8.0.0", "ruff": "0.12.0", "mkdocstrings": "0.30.0"}
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", list(versions)),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", side_effect=versions.get),
+        ):
+            count = PyprojectTomlUpdater([temp_pyproject]).update()
+
+        assert count == 3
+        content = temp_pyproject.read_text()
+        assert '"pytest>=8.0.0"' in content
+        assert '"ruff>=0.12.0"' in content
+        assert '"mkdocstrings[python]>=0.30.0"' in content
+
+    def test_distinguishes_packages_sharing_a_prefix(self, tmp_path: Path) -> None:
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('dev = ["mkdocs>=1.0.0", "mkdocs-material>=9.0.0", "pytest-cov>=4.0.0"]\n')
+        versions = {"mkdocs": "1.6.1", "mkdocs-material": "9.7.1", "pytest": "9.0.2"}
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", list(versions)),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", side_effect=versions.get),
+        ):
+            count = PyprojectTomlUpdater([pyproject]).update()
+
+        assert count == 2
+        assert pyproject.read_text() == 'dev = ["mkdocs>=1.6.1", "mkdocs-material>=9.7.1", "pytest-cov>=4.0.0"]\n'
+
     def test_dry_run_does_not_modify(self, temp_pyproject: Path) -> None:
         original = temp_pyproject.read_text()
         with (
             patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
             patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="8.0.0"),
         ):
-            PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True)
+            count = PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True)
 
+        assert count == 1
         assert temp_pyproject.read_text() == original
 
+    def test_unchanged_file_is_not_reread(self, temp_pyproject: Path) -> None:
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="8.0.0"),
+        ):
+            assert PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True) == 1
+            with patch.object(Path, "read_bytes", side_effect=AssertionError("file was re-read")):
+                assert PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True) == 1
+
+    def test_modified_file_is_rescanned(self, temp_pyproject: Path) -> None:
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="8.0.0"),
+        ):
+            assert PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True) == 1
+            temp_pyproject.write_text('dev = ["pytest>=8.0.0"]\n')
+            assert PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True) == 0
+
+    def test_update_rereads_file_with_unchanged_stat(self, tmp_path: Path) -> None:
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('dev = ["pytest>=8.0.0"]\n')
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="8.0.0"),
+        ):
+            assert PyprojectTomlUpdater([pyproject]).update(dry_run=True) == 0
+            stat = pyproject.stat()
+            pyproject.write_text('dev = ["pytest>=7.0.0"]\n')
+            os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert PyprojectTomlUpdater([pyproject]).update() == 1
+
+        assert pyproject.read_text() == 'dev = ["pytest>=8.0.0"]\n'
+
+    def test_scan_cache_only_keeps_current_files(self, tmp_path: Path, temp_pyproject: Path) -> None:
+        other = tmp_path / "other.toml"
+        other.write_text('dev = ["pytest>=7.0.0"]\n')
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="8.0.0"),
+        ):
+            PyprojectTomlUpdater([other]).update(dry_run=True)
+            PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True)
+
+        assert list(cache.read_scan_cache(["pytest"])) == [str(temp_pyproject.resolve())]
+
+    def test_dry_run_skips_current_versions(self, temp_pyproject: Path) -> None:
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PYPI_PACKAGES", ["pytest"]),
+            patch("cookiecutter_uv.cicd.updaters.get_pypi_version", return_value="7.2.0"),
+        ):
+            count = PyprojectTomlUpdater([temp_pyproject]).update(dry_run=True)
+
+        assert count == 0
+
 
 class TestActionYmlUpdater:
     def test_updates_uv_version(self, temp_action_yml: Path) -> None:
@@ -120,6 +363,12 @@ class TestActionYmlUpdater:
         content = temp_action_yml.read_text()
         assert 'default: "0.9.7"' in content
 
+    def test_current_version_is_not_rewritten(self, temp_action_yml: Path) -> None:
+        with patch("cookiecutter_uv.cicd.updaters.get_github_release", return_value="0.5.0"):
+            count = ActionYmlUpdater([temp_action_yml]).update()
+
+        assert count == 0
+
 
 class TestPreCommitConfigUpdater:
     def test_updates_hook_revision(self, temp_precommit: Path) -> None:
@@ -128,10 +377,33 @@ class TestPreCommitConfigUpdater:
         ]
         with (
             patch("cookiecutter_uv.cicd.updaters.PREK_HOOKS", hooks),
-            patch("cookiecutter_uv.cicd.updaters.get_github_tag", return_value="5.0.0"),
+            patch(
+                "cookiecutter_uv.cicd.updaters.get_github_tags_batch",
+                side_effect=lambda repos: dict.fromkeys(repos, "5.0.0"),
+            ),
         ):
             count = PreCommitConfigUpdater(temp_precommit).update()
 
         assert count == 1
         content = temp_precommit.read_text()
         assert 'rev: "v5.0.0"' in content
+
+    def test_updates_all_hooks_in_one_pass(self, temp_precommit: Path) -> None:
+        versions = {
+            GitHubRepo("pre-commit", "pre-commit-hooks"): "6.0.0",
+            GitHubRepo("astral-sh", "ruff-pre-commit"): None,
+        }
+        hooks = [
+            ("https://github.com/pre-commit/pre-commit-hooks", GitHubRepo("pre-commit", "pre-commit-hooks")),
+            ("https://github.com/astral-sh/ruff-pre-commit", GitHubRepo("astral-sh", "ruff-pre-commit")),
+        ]
+        with (
+            patch("cookiecutter_uv.cicd.updaters.PREK_HOOKS", hooks),
+            patch("cookiecutter_uv.cicd.updaters.get_github_tags_batch", return_value=versions),
+        ):
+            count = PreCommitConfigUpdater(temp_precommit).update()
+
+        assert count == 1
+        content = temp_precommit.read_text()
+        assert 'rev: "v6.0.0"' in content
+        assert 'rev: "v0.1.0"' in content
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess  # noqa: S404  # subprocess is safe in test utilities with controlled input
+import sys
+
+HOOKS_DIR = pathlib.Path(__file__).parent.parent / "hooks"
+
+
+def run_pre_gen_hook(tmp_path, python_version, uv_python_list):
+    """Render and run the pre-generation hook with a fake uv on PATH.
+
+    Returns:
+        CompletedProcess: Result of running the hook.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    uv = bin_dir / "uv"
+    uv.write_text(f"#!/bin/sh\ncat <<'EOF'\n{uv_python_list}\nEOF\n")
+    uv.chmod(0o755)
+
+    hook = (HOOKS_DIR / "pre_gen_project.py").read_text()
+    context = {"project_name": "example-project", "project_slug": "example_project", "python_version": python_version}
+    for key, value in context.items():
+        hook = hook.replace(f"{{{{cookiecutter.{key}}}}}", value)
+    hook_path = tmp_path / "pre_gen_project.py"
+    hook_path.write_text(hook)
+
+    env = {**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}
+    return subprocess.run(  # noqa: S603  # controlled test command
+        [sys.executable, str(hook_path)], capture_output=True, text=True, env=env, check=False
+    )
+
+
+def test_pre_gen_hook_rejects_version_prefix(tmp_path):
+    # 3.1 must not be satisfied by an installed 3.10
+    result = run_pre_gen_hook(tmp_path, "3.1", "cpython-3.10.4-linux-x86_64-gnu    /usr/bin/python3.10")
+    assert result.returncode == 1
+    assert "Python 3.1 is not installed via uv" in result.stdout
+
+
+def test_pre_gen_hook_accepts_installed_version(tmp_path):
+    result = run_pre_gen_hook(tmp_path, "3.1", "cpython-3.1.5-linux-x86_64-gnu    /usr/bin/python3.1")
+    assert result.returncode == 0
+    assert "Using Python 3.1 (uv-managed)" in result.stdout